@@ -3,9 +3,8 @@ Updated test example showing how to use the new LoggerController integration.
 """
 
 import pytest
-import time
 from playwright.sync_api import Page
-from src.page_objects.home_page import HomePage
+from src.page_objects.home_page import HomePage, HomePageLocators
 from src.constants.urls import WebUrls
 
 
@@ -25,7 +24,10 @@ def test_verify_that_all_posts_are_displayed_with_logging(
     try:
         # Log navigation action
         logger_controller.log_action("Navigate to home page", {"url": WebUrls.BASE_URL})
-        page.goto(WebUrls.BASE_URL)
+        # "commit" returns as soon as the response starts; wait on the posts
+        # themselves instead of every image and third-party script
+        page.goto(WebUrls.BASE_URL, wait_until="commit")
+        page.locator(HomePageLocators.POST_ITEMS_LOCATOR).first.wait_for()
         
         # Set step for page interaction
         logger_controller.set_current_step("Page Interaction")
@@ -84,31 +86,27 @@ def test_verify_post_navigation_with_performance_logging(
     logger_controller.set_current_step("Setup and Navigation")
     
     # Track navigation performance
-    nav_start = time.time()
-    page.goto(WebUrls.BASE_URL)
-    nav_duration = time.time() - nav_start
-    logger_controller.log_performance("Initial page load", nav_duration)
+    with logger_controller.time_block("Initial page load"):
+        page.goto(WebUrls.BASE_URL, wait_until="commit")
+        page.locator(HomePageLocators.POST_ITEMS_LOCATOR).first.wait_for()
     
     home_page = HomePage(page)
     
     # Load posts with performance tracking
-    load_start = time.time()
-    home_page.scroll_to_bottom()
-    posts = home_page.get_all_posts()
-    load_duration = time.time() - load_start
-    logger_controller.log_performance("Posts loading", load_duration, {"posts_count": len(posts)})
+    with logger_controller.time_block("Posts loading") as perf:
+        home_page.scroll_to_bottom()
+        posts = home_page.get_all_posts()
+        perf["posts_count"] = len(posts)
     
     if posts:
         logger_controller.set_current_step("Post Navigation")
         
         # Test clicking on first post
         first_post = posts[0]
-        click_start = time.time()
         
         try:
-            home_page.click_on_post_part(first_post, "title")
-            click_duration = time.time() - click_start
-            logger_controller.log_performance("Post click navigation", click_duration)
+            with logger_controller.time_block("Post click navigation"):
+                home_page.click_on_post_part(first_post, "title")
             
             # Verify navigation
             logger_controller.set_current_step("Navigation Verification")
@@ -117,8 +115,6 @@ def test_verify_post_navigation_with_performance_logging(
             logger_controller.step_passed("Post navigation", "Successfully navigated to post detail")
             
         except Exception as e:
-            click_duration = time.time() - click_start
-            logger_controller.log_performance("Failed post click", click_duration)
             logger_controller.step_failed("Post navigation", str(e))
             raise
         
@@ -142,12 +138,20 @@ def test_multi_step_workflow_with_detailed_logging(
     """
     Test demonstrating multi-step workflow with detailed logging.
     """
+    home_page = None
+
+    def init_page_objects():
+        # Built once here and reused by the steps that follow
+        nonlocal home_page
+        home_page = HomePage(page)
+        return home_page
     
     workflow_steps = [
-        ("Navigate to homepage", lambda: page.goto(WebUrls.BASE_URL)),
+        # The next step waits for network idle, so navigation only needs to commit
+        ("Navigate to homepage", lambda: page.goto(WebUrls.BASE_URL, wait_until="commit")),
         ("Wait for page load", lambda: page.wait_for_load_state("networkidle")),
-        ("Initialize page objects", lambda: HomePage(page)),
-        ("Scroll to load posts", lambda: HomePage(page).scroll_to_bottom()),
+        ("Initialize page objects", init_page_objects),
+        ("Scroll to load posts", lambda: home_page.scroll_to_bottom()),
         ("Verify page title", lambda: verify_page_title(page)),
         ("Check page responsiveness", lambda: page.wait_for_selector("body", timeout=5000))
     ]
@@ -157,22 +161,22 @@ def test_multi_step_workflow_with_detailed_logging(
     
     for step_name, step_action in workflow_steps:
         logger_controller.set_current_step(step_name)
+        perf = {}
         
         try:
             logger_controller.info(f"Executing: {step_name}")
             
             # Execute step with timing
-            start_time = time.time()
-            result = step_action()
-            duration = time.time() - start_time
+            with logger_controller.time_block(f"Step: {step_name}") as perf:
+                result = step_action()
+            duration = perf["duration_seconds"]
             
             # Log success
-            logger_controller.log_performance(f"Step: {step_name}", duration)
             logger_controller.step_passed(step_name, f"Completed in {duration:.3f}s")
             successful_steps += 1
             
         except Exception as e:
-            duration = time.time() - start_time if 'start_time' in locals() else 0
+            duration = perf.get("duration_seconds", 0)
             error_details = {
                 "step": step_name,
                 "error": str(e),
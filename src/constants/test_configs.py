@@ -4,6 +4,22 @@ class TimeoutConstants:
     DEFAULT_TIMEOUT = 30  # Default timeout in seconds
     SHORT_TIMEOUT = 10  # Short timeout in seconds
     LONG_TIMEOUT = 60  # Long timeout in seconds
+    ELEMENT_TIMEOUT = 5  # Element expected right after a navigation, in seconds
+    PROBE_TIMEOUT = 1  # Read of an element already known to exist, in seconds
+
+
+class BrowserConstants:
+    """Constants for browser launch settings."""
+
+    # Chromium flags for containerized CI runners (small /dev/shm, no user namespaces)
+    CI_CHROMIUM_ARGS = (
+        "--disable-dev-shm-usage",
+        "--no-sandbox",
+        "--disable-gpu",
+        "--disable-background-networking",
+        "--disable-extensions",
+        "--disable-default-apps",
+    )
 
 
 class ScrollConstants:
@@ -13,6 +29,12 @@ class ScrollConstants:
     SCROLL_DELAY = 200  # Delay in milliseconds between scrolls
 
 
+class PaginationConstants:
+    """Constants for paginated post listings."""
+
+    POSTS_PER_PAGE = 10  # Number of posts expected once a home page is fully loaded
+
+
 class MobileDeviceConstants:
     """Constants for mobile device configurations."""
 
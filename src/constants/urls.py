@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 # Load environment variables before using them
 from src.utils.env_utils import load_dotenv_file
@@ -13,12 +14,34 @@ class WebUrls:
 
     # Base URL for the application
     BASE_URL = os.getenv("BASE_URL")
-    GET_ALL_POST_URL = f"{BASE_URL}/author/{{author_id}}"
+
+    @classmethod
+    def _base(cls) -> str:
+        """Return BASE_URL, failing fast when it is not configured."""
+        if not cls.BASE_URL:
+            raise RuntimeError(
+                "BASE_URL is not set. Check the .env file selected by TARGET_ENV."
+            )
+        return cls.BASE_URL
+
+    @classmethod
+    @lru_cache()
+    def get_author_url(cls, author_id) -> str:
+        """URL listing all posts of the given author."""
+        return f"{cls._base()}/author/{author_id}"
 
 
 class SearchApis:
-    SEARCH_API_URL = f"{WebUrls.BASE_URL}/?s={{query}}"
-    GET_RELATED_POSTS_URL = f"{{POST_URL}}?relatedposts=1"
+    @classmethod
+    @lru_cache()
+    def get_search_url(cls, query: str) -> str:
+        """URL searching posts for the given query."""
+        return f"{WebUrls._base()}/?s={query}"
+
+    @staticmethod
+    def get_related_posts_url(post_url: str) -> str:
+        """URL returning the posts related to the given post."""
+        return f"{post_url}?relatedposts=1"
 
 
 class ApiUrls:
@@ -43,15 +43,18 @@ class TestDecorationController:
         scope: Literal["function", "session"] = "function",
     ):
         makers = metafunc.definition.own_markers
-        # Get the devices from the markers
-        marker_args = [
-            marker.args
-            for marker in makers
-            if marker.name == maker_name and marker.args
-        ]
+        # Get the devices from the first matching marker
+        marker_args = next(
+            (
+                marker.args
+                for marker in makers
+                if marker.name == maker_name and marker.args
+            ),
+            None,
+        )
         if marker_args:
             metafunc.parametrize(
-                parameter_name, marker_args[0], indirect=True, scope=scope
+                parameter_name, marker_args, indirect=True, scope=scope
             )
 
     @staticmethod
@@ -1,11 +1,57 @@
 import logging
+import atexit
 import datetime
-import inspect
 import os
+import queue
+import sys
 import json
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from collections import Counter, deque
+from typing import Deque, Iterator, List, Dict, Any, Optional, Tuple
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup for JSON export
+    orjson = None
+
+# Cache of code filename -> basename, filenames repeat across log calls
+_BASENAME_CACHE: Dict[str, str] = {}
+
+# Raw log record: (timestamp, level, message, caller_info, step_name, extra_data)
+_RawEntry = Tuple[str, str, str, str, Optional[str], Optional[Dict[str, Any]]]
+
+# Console format; _emit always sets caller_info on the records it emits
+_CONSOLE_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s:%(caller_info)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+    defaults={"caller_info": ""},
+)
+
+
+class _ConsoleHandler(logging.StreamHandler):
+    """StreamHandler writing each record with a single os.write on the stream fd."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            fd = self.stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            # Streams without a file descriptor (e.g. captured output) keep the
+            # regular write + flush path
+            super().emit(record)
+            return
+
+        try:
+            encoding = getattr(self.stream, "encoding", None) or "utf-8"
+            data = (self.format(record) + self.terminator).encode(encoding, "replace")
+            while data:
+                data = data[os.write(fd, data) :]
+        except Exception:
+            self.handleError(record)
 
 
 class LogLevel(Enum):
@@ -18,7 +64,7 @@ class LogLevel(Enum):
     CRITICAL = "CRITICAL"
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """Data class representing a single log entry."""
 
@@ -32,7 +78,16 @@ class LogEntry:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert log entry to dictionary."""
-        return asdict(self)
+        # Built by hand: asdict() deep-copies every field, including extra_data
+        return {
+            "timestamp": self.timestamp,
+            "level": self.level,
+            "message": self.message,
+            "test_name": self.test_name,
+            "caller_info": self.caller_info,
+            "step_name": self.step_name,
+            "extra_data": self.extra_data,
+        }
 
 
 class LoggerController:
@@ -48,103 +103,153 @@ class LoggerController:
     - Screenshot attachment support
     """
 
+    # Console output is written by a single background listener shared by all
+    # controllers, so log calls only enqueue records on the test thread.
+    _console_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    _console_listener: Optional[QueueListener] = None
+    _console_users = 0
+    _console_lock = threading.Lock()
+
     def __init__(self, test_name: str = "", enable_console: bool = True):
         """Initialize the logger controller."""
         self.test_name = test_name
-        self.log_entries: List[LogEntry] = []
+        # Entries are kept as plain tuples and only wrapped in LogEntry on read
+        self._raw: Deque[_RawEntry] = deque()
         self.current_step: Optional[str] = None
         self.test_start_time = datetime.datetime.now()
 
+        # Set PLW_CAPTURE_CALLER=0 to skip file:line resolution on every log call
+        self._capture_caller = os.getenv("PLW_CAPTURE_CALLER", "1") == "1"
+
         # Setup Python logger
         self.logger = logging.getLogger(f"TestLogger.{test_name}")
         self.logger.setLevel(logging.DEBUG)
         self.logger.handlers.clear()
 
+        self._uses_console = enable_console
         if enable_console:
             self._setup_console_handler()
 
-    def _get_caller_info(self, skip_frames: int = 2) -> str:
+    def _setup_console_handler(self) -> None:
+        """Setup console logging through the shared queue listener."""
+        queue_handler = QueueHandler(self._console_queue)
+        queue_handler.setLevel(logging.INFO)
+        self.logger.addHandler(queue_handler)
+        self._start_console_listener()
+
+    @classmethod
+    def _start_console_listener(cls) -> None:
+        """Start the console listener thread if it is not running yet."""
+        with cls._console_lock:
+            cls._console_users += 1
+            if cls._console_listener is not None:
+                return
+
+            console_handler = _ConsoleHandler()
+            console_handler.setFormatter(_CONSOLE_FORMATTER)
+
+            cls._console_listener = QueueListener(cls._console_queue, console_handler)
+            cls._console_listener.start()
+
+    @classmethod
+    def _stop_console_listener(cls, force: bool = False) -> None:
         """
-        Get caller file and line number information.
+        Release the console listener, stopping it once no controller uses it.
 
         Args:
-            skip_frames: Number of frames to skip (default 2 to skip this method and the calling log method)
-
-        Returns:
-            String in format "filename.py:line_number"
+            force: Stop the listener regardless of remaining users (used at exit)
         """
-        try:
-            # Get the current stack
-            stack = inspect.stack()
-
-            # Skip internal frames to find the actual caller
-            if len(stack) > skip_frames:
-                frame = stack[skip_frames]
-                filename = os.path.basename(frame.filename)
-                line_number = frame.lineno
-                return f"{filename}:{line_number}"
-        except Exception:
-            pass
+        with cls._console_lock:
+            cls._console_users = 0 if force else max(cls._console_users - 1, 0)
+            if cls._console_listener is None or cls._console_users:
+                return
 
-        return "unknown:0"
+            # stop() drains every queued record before joining the thread
+            cls._console_listener.stop()
+            cls._console_listener = None
 
-    def _setup_console_handler(self) -> None:
-        """Setup console logging handler with custom formatter."""
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-
-        # Custom formatter that includes caller info
-        class CallerFormatter(logging.Formatter):
-            def format(self, record):
-                # Add caller info to the record if available
-                if hasattr(record, "caller_info"):
-                    record.name_with_caller = f"{record.name}:{record.caller_info}"
-                else:
-                    record.name_with_caller = record.name
-                return super().format(record)
-
-        formatter = CallerFormatter(
-            "%(asctime)s - %(name_with_caller)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+    def _handler_threshold(self) -> int:
+        """
+        Lowest level accepted by any handler this logger reaches, propagation included.
 
-    def _log(
+        Walked on every call because handlers may be attached later, e.g. the
+        ones pytest's logging plugin adds to the root logger during a test.
+        """
+        threshold: Optional[int] = None
+        logger: Optional[logging.Logger] = self.logger
+        while logger is not None:
+            for handler in logger.handlers:
+                if threshold is None or handler.level < threshold:
+                    threshold = handler.level
+            if not logger.propagate:
+                break
+            logger = logger.parent
+
+        if threshold is None:
+            # No handler at all: logging falls back to lastResort, if any
+            last_resort = logging.lastResort
+            return last_resort.level if last_resort else logging.CRITICAL + 1
+        return threshold
+
+    def _emit(
         self,
-        level: LogLevel,
+        level_int: int,
+        level_name: str,
         message: str,
         extra_data: Optional[Dict[str, Any]] = None,
-        skip_frames: int = 3,  # Skip _log, calling method, and get to actual caller
-    ) -> LogEntry:
+        stacklevel: int = 1,
+    ) -> None:
         """
         Internal logging method with caller tracking.
 
+        Public log methods call this directly, so the caller to report is
+        found relative to this frame rather than through a helper.
+
         Args:
-            level: Log level
+            level_int: stdlib logging level, e.g. logging.INFO
+            level_name: Matching LogLevel value stored on the entry, e.g. "INFO"
             message: Log message
             extra_data: Optional extra data
-            skip_frames: Number of stack frames to skip to find actual caller
+            stacklevel: Like logging's stacklevel, 1 reports the caller of the
+                public log method
         """
         timestamp = datetime.datetime.now().isoformat()
-        caller_info = self._get_caller_info(skip_frames)
-
-        log_entry = LogEntry(
-            timestamp=timestamp,
-            level=level.value,
-            message=message,
-            test_name=self.test_name,
-            caller_info=caller_info,
-            step_name=self.current_step,
-            extra_data=extra_data or {},
+        caller_info = ""
+        if self._capture_caller:
+            try:
+                # Grab only the frame we need instead of materializing the stack
+                frame = sys._getframe(stacklevel + 1)
+            except ValueError:
+                caller_info = "unknown:0"
+            else:
+                filename = frame.f_code.co_filename
+                basename = _BASENAME_CACHE.get(filename)
+                if basename is None:
+                    basename = _BASENAME_CACHE[filename] = os.path.basename(filename)
+                caller_info = f"{basename}:{frame.f_lineno}"
+
+        self._raw.append(
+            (
+                timestamp,
+                level_name,
+                message,
+                caller_info,
+                self.current_step,
+                extra_data,
+            )
         )
 
-        self.log_entries.append(log_entry)
+        # Log to Python logger with caller info, skipping record creation when
+        # no handler would accept it. The logger itself is pinned to DEBUG, so
+        # isEnabledFor() alone never filters anything out.
+        if level_int < self._handler_threshold() or not self.logger.isEnabledFor(
+            level_int
+        ):
+            return
 
-        # Log to Python logger with caller info
         log_record = self.logger.makeRecord(
             name=self.logger.name,
-            level=getattr(logging, level.value),
+            level=level_int,
             fn="",
             lno=0,
             msg=message,
@@ -154,56 +259,64 @@ class LoggerController:
         log_record.caller_info = caller_info
         self.logger.handle(log_record)
 
-        return log_entry
+    def _to_entry(self, raw: _RawEntry) -> LogEntry:
+        """Wrap a raw log tuple into a LogEntry."""
+        timestamp, level, message, caller_info, step_name, extra_data = raw
+        return LogEntry(
+            timestamp=timestamp,
+            level=level,
+            message=message,
+            test_name=self.test_name,
+            caller_info=caller_info,
+            step_name=step_name,
+            extra_data=extra_data or {},
+        )
+
+    @property
+    def log_entries(self) -> List[LogEntry]:
+        """All stored log entries, in logging order."""
+        return [self._to_entry(raw) for raw in self._raw]
 
     def set_current_step(self, step_name: str) -> None:
         """Set the current test step for context."""
         self.current_step = step_name
-        self._log(LogLevel.INFO, f"=== Starting Step: {step_name} ===", skip_frames=3)
+        self._emit(logging.INFO, "INFO", f"=== Starting Step: {step_name} ===")
 
     def clear_current_step(self) -> None:
         """Clear the current test step."""
         if self.current_step:
-            self._log(
-                LogLevel.INFO,
-                f"=== Completed Step: {self.current_step} ===",
-                skip_frames=3,
+            self._emit(
+                logging.INFO, "INFO", f"=== Completed Step: {self.current_step} ==="
             )
         self.current_step = None
 
-    def info(
-        self, message: str, extra_data: Optional[Dict[str, Any]] = None
-    ) -> LogEntry:
+    def info(self, message: str, extra_data: Optional[Dict[str, Any]] = None) -> None:
         """Log info message."""
-        return self._log(LogLevel.INFO, message, extra_data, skip_frames=3)
+        self._emit(logging.INFO, "INFO", message, extra_data)
 
-    def debug(
-        self, message: str, extra_data: Optional[Dict[str, Any]] = None
-    ) -> LogEntry:
+    def debug(self, message: str, extra_data: Optional[Dict[str, Any]] = None) -> None:
         """Log debug message."""
-        return self._log(LogLevel.DEBUG, message, extra_data, skip_frames=3)
+        self._emit(logging.DEBUG, "DEBUG", message, extra_data)
 
     def warning(
         self, message: str, extra_data: Optional[Dict[str, Any]] = None
-    ) -> LogEntry:
+    ) -> None:
         """Log warning message."""
-        return self._log(LogLevel.WARNING, message, extra_data, skip_frames=3)
+        self._emit(logging.WARNING, "WARNING", message, extra_data)
 
-    def error(
-        self, message: str, extra_data: Optional[Dict[str, Any]] = None
-    ) -> LogEntry:
+    def error(self, message: str, extra_data: Optional[Dict[str, Any]] = None) -> None:
         """Log error message."""
-        return self._log(LogLevel.ERROR, message, extra_data, skip_frames=3)
+        self._emit(logging.ERROR, "ERROR", message, extra_data)
 
     def critical(
         self, message: str, extra_data: Optional[Dict[str, Any]] = None
-    ) -> LogEntry:
+    ) -> None:
         """Log critical message."""
-        return self._log(LogLevel.CRITICAL, message, extra_data, skip_frames=3)
+        self._emit(logging.CRITICAL, "CRITICAL", message, extra_data)
 
     def log_assertion(
         self, message: str, passed: bool, extra_data: Optional[Dict[str, Any]] = None
-    ) -> LogEntry:
+    ) -> None:
         """
         Log assertion result with caller information.
 
@@ -215,22 +328,22 @@ class LoggerController:
         status = "✅ PASSED" if passed else "❌ FAILED"
         full_message = f"{status} ASSERTION: {message}"
 
-        level = LogLevel.INFO if passed else LogLevel.ERROR
-        return self._log(level, full_message, extra_data, skip_frames=3)
+        if passed:
+            self._emit(logging.INFO, "INFO", full_message, extra_data)
+        else:
+            self._emit(logging.ERROR, "ERROR", full_message, extra_data)
 
     def log_action(
         self, action: str, extra_data: Optional[Dict[str, Any]] = None
-    ) -> LogEntry:
+    ) -> None:
         """Log test action with caller info."""
-        return self._log(
-            LogLevel.INFO, f"🔄 ACTION: {action}", extra_data, skip_frames=3
-        )
+        self._emit(logging.INFO, "INFO", f"🔄 ACTION: {action}", extra_data)
 
-    def log_screenshot(self, screenshot_path: str, description: str = "") -> LogEntry:
+    def log_screenshot(self, screenshot_path: str, description: str = "") -> None:
         """Log screenshot capture with caller info."""
         message = f"📸 SCREENSHOT: {description} - {screenshot_path}"
-        return self._log(
-            LogLevel.INFO, message, {"screenshot_path": screenshot_path}, skip_frames=3
+        self._emit(
+            logging.INFO, "INFO", message, {"screenshot_path": screenshot_path}
         )
 
     def log_performance(
@@ -238,46 +351,81 @@ class LoggerController:
         action: str,
         duration_seconds: float,
         extra_data: Optional[Dict[str, Any]] = None,
-    ) -> LogEntry:
+    ) -> None:
         """Log performance metrics with caller info."""
+        message, perf_data = self._performance_entry(
+            action, duration_seconds, extra_data
+        )
+        self._emit(logging.INFO, "INFO", message, perf_data)
+
+    @contextmanager
+    def time_block(
+        self, action: str, extra_data: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Time the wrapped block and log it as a performance metric on exit.
+
+        The yielded dict is logged as extra data, so values added inside the
+        block are recorded too. "duration_seconds" is set on it once the block
+        ends, including when it raises.
+
+        Example:
+            with logger.time_block("Posts loading") as perf:
+                posts = home_page.get_all_posts()
+                perf["posts_count"] = len(posts)
+        """
+        perf_data: Dict[str, Any] = dict(extra_data or {})
+        start = time.perf_counter_ns()
+        try:
+            yield perf_data
+        finally:
+            duration_seconds = (time.perf_counter_ns() - start) / 1e9
+            message, entry_data = self._performance_entry(
+                action, duration_seconds, perf_data
+            )
+            perf_data["duration_seconds"] = duration_seconds
+            # Skip the contextlib frame so caller info points at the with block
+            self._emit(logging.INFO, "INFO", message, entry_data, stacklevel=2)
+
+    @staticmethod
+    def _performance_entry(
+        action: str, duration_seconds: float, extra_data: Optional[Dict[str, Any]]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build the message and extra data of a performance log entry."""
         message = f"⏱️ PERFORMANCE: {action} took {duration_seconds:.2f}s"
         perf_data = {"duration_seconds": duration_seconds, "action": action}
         if extra_data:
             perf_data.update(extra_data)
-        return self._log(LogLevel.INFO, message, perf_data, skip_frames=3)
+        return message, perf_data
 
-    def step_passed(self, step_name: str, message: str) -> LogEntry:
+    def step_passed(self, step_name: str, message: str) -> None:
         """Log passed step with caller info."""
-        return self._log(
-            LogLevel.INFO, f"✅ STEP PASSED: {step_name} - {message}", skip_frames=3
-        )
+        self._emit(logging.INFO, "INFO", f"✅ STEP PASSED: {step_name} - {message}")
 
-    def step_failed(self, step_name: str, message: str) -> LogEntry:
+    def step_failed(self, step_name: str, message: str) -> None:
         """Log failed step with caller info."""
-        return self._log(
-            LogLevel.ERROR, f"❌ STEP FAILED: {step_name} - {message}", skip_frames=3
-        )
+        self._emit(logging.ERROR, "ERROR", f"❌ STEP FAILED: {step_name} - {message}")
 
-    def step_skipped(self, step_name: str, message: str) -> LogEntry:
+    def step_skipped(self, step_name: str, message: str) -> None:
         """Log skipped step with caller info."""
-        return self._log(
-            LogLevel.WARNING, f"⏭️ STEP SKIPPED: {step_name} - {message}", skip_frames=3
+        self._emit(
+            logging.WARNING, "WARNING", f"⏭️ STEP SKIPPED: {step_name} - {message}"
         )
 
     def get_logs_by_level(self, level: LogLevel) -> List[LogEntry]:
         """Get all log entries of a specific level."""
-        return [entry for entry in self.log_entries if entry.level == level.value]
+        return [self._to_entry(raw) for raw in self._raw if raw[1] == level.value]
 
     def get_logs_by_step(self, step_name: str) -> List[LogEntry]:
         """Get all log entries for a specific step."""
-        return [entry for entry in self.log_entries if entry.step_name == step_name]
+        return [self._to_entry(raw) for raw in self._raw if raw[4] == step_name]
 
     def get_error_logs(self) -> List[LogEntry]:
         """Get all error and critical log entries."""
         return [
-            entry
-            for entry in self.log_entries
-            if entry.level in [LogLevel.ERROR.value, LogLevel.CRITICAL.value]
+            self._to_entry(raw)
+            for raw in self._raw
+            if raw[1] in [LogLevel.ERROR.value, LogLevel.CRITICAL.value]
         ]
 
     def get_test_summary(self) -> Dict[str, Any]:
@@ -287,11 +435,9 @@ class LoggerController:
         Returns:
             Dictionary containing test summary information
         """
-        total_logs = len(self.log_entries)
-        logs_by_level = {}
-
-        for level in LogLevel:
-            logs_by_level[level.value.lower()] = len(self.get_logs_by_level(level))
+        total_logs = len(self._raw)
+        counts = Counter(raw[1] for raw in self._raw)
+        logs_by_level = {level.value.lower(): counts[level.value] for level in LogLevel}
 
         error_count = logs_by_level.get("error", 0) + logs_by_level.get("critical", 0)
 
@@ -332,28 +478,36 @@ class LoggerController:
                 "log_entries": [entry.to_dict() for entry in self.log_entries],
             }
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
-
-        elif format_type.lower() == "txt":
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(f"Test Log Report: {self.test_name}\n")
-                f.write("=" * 50 + "\n\n")
-
-                for entry in self.log_entries:
-                    step_info = f"[{entry.step_name}] " if entry.step_name else ""
-                    caller_info = (
-                        f" ({entry.caller_info})"
-                        if hasattr(entry, "caller_info") and entry.caller_info
-                        else ""
-                    )
+            if orjson is not None:
+                with open(file_path, "wb") as f:
                     f.write(
-                        f"{entry.timestamp} - {entry.level}{caller_info} - {step_info}{entry.message}\n"
+                        orjson.dumps(
+                            export_data,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                        )
                     )
+            else:
+                with open(file_path, "w", encoding="utf-8") as f:
+                    json.dump(export_data, f, indent=2, ensure_ascii=False)
 
-                    if entry.extra_data:
-                        f.write(f"    Extra Data: {entry.extra_data}\n")
-                    f.write("\n")
+        elif format_type.lower() == "txt":
+            # Build the whole report in memory and hand it to the file in one write
+            lines = [f"Test Log Report: {self.test_name}\n", "=" * 50 + "\n\n"]
+            for timestamp, level, message, caller_info, step_name, extra_data in (
+                self._raw
+            ):
+                step_info = f"[{step_name}] " if step_name else ""
+                caller_info = f" ({caller_info})" if caller_info else ""
+                lines.append(
+                    f"{timestamp} - {level}{caller_info} - {step_info}{message}\n"
+                )
+
+                if extra_data:
+                    lines.append(f"    Extra Data: {extra_data}\n")
+                lines.append("\n")
+
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write("".join(lines))
 
         elif format_type.lower() == "csv":
             with open(file_path, "w", newline="", encoding="utf-8") as f:
@@ -370,24 +524,31 @@ class LoggerController:
                     ]
                 )
 
-                for entry in self.log_entries:
-                    writer.writerow(
-                        [
-                            entry.timestamp,
-                            entry.level,
-                            entry.test_name,
-                            getattr(entry, "caller_info", ""),
-                            entry.step_name or "",
-                            entry.message,
-                            json.dumps(entry.extra_data) if entry.extra_data else "",
-                        ]
+                writer.writerows(
+                    (
+                        timestamp,
+                        level,
+                        self.test_name,
+                        caller_info,
+                        step_name or "",
+                        message,
+                        json.dumps(extra_data) if extra_data else "",
                     )
+                    for (
+                        timestamp,
+                        level,
+                        message,
+                        caller_info,
+                        step_name,
+                        extra_data,
+                    ) in self._raw
+                )
 
         return file_path
 
     def clear_logs(self) -> None:
         """Clear all stored log entries."""
-        self.log_entries.clear()
+        self._raw.clear()
         self.current_step = None
         self.test_start_time = datetime.datetime.now()
 
@@ -407,3 +568,11 @@ class LoggerController:
             f"Total logs: {summary['total_log_entries']}, "
             f"Errors: {summary['error_count']}"
         )
+
+        if self._uses_console:
+            self._uses_console = False
+            self._stop_console_listener()
+
+
+# Flush console records still queued by controllers that were never exited
+atexit.register(LoggerController._stop_console_listener, force=True)
@@ -1,12 +1,41 @@
-from typing import List
+from typing import Dict, List
 from typing_extensions import Literal
-from playwright.sync_api import Page
+from playwright.sync_api import Locator, Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
-from src.constants.test_configs import ScrollConstants
+from src.constants.test_configs import PaginationConstants, TimeoutConstants
 from src.utils.scroll_utils import ScrollUtils
 from .models.post_item import PostItem
 from .post_detail_page import PostDetailPage
 
+# Reads every post's fields in the browser, skipping posts missing any of them
+_EXTRACT_POSTS_JS = """
+(sel) => Array.from(document.querySelectorAll(sel.items)).map((li, index) => {
+    const title = li.querySelector(sel.title);
+    const image = li.querySelector(sel.image);
+    const date = li.querySelector(sel.date);
+    if (!title || !image || !date) {
+        return null;
+    }
+    // Same rule as Playwright's is_visible(): non-empty box, not visibility:hidden
+    const rect = li.getBoundingClientRect();
+    return {
+        index,
+        // Raw DOM text, read the same way as PostDetailPage.get_post_title()
+        title: title.textContent.trim(),
+        image_url: image.getAttribute("src"),
+        created_date: date.innerText.trim(),
+        visible: rect.width > 0 && rect.height > 0
+            && getComputedStyle(li).visibility !== "hidden",
+    };
+}).filter(Boolean)
+"""
+
+# True once at least `count` post items are in the DOM
+_POSTS_LOADED_JS = (
+    "([selector, count]) => document.querySelectorAll(selector).length >= count"
+)
+
 
 class HomePageLocators:
     """
@@ -35,47 +64,82 @@ class HomePageLocators:
 
 
 class HomePage:
+    # Post part -> locator used by click_on_post_part
+    _PART_LOCATORS = {
+        "image": HomePageLocators.POST_IMAGE_LOCATOR,
+        "title": HomePageLocators.POST_TITLE_LOCATOR,
+        "date": HomePageLocators.POST_DATE_LOCATOR,
+    }
 
     def __init__(self, page: Page, logger=None):
         self.page = page
         self.locators = HomePageLocators()
         self.logger = logger
 
-    def _extract_post_item(self, post_element) -> PostItem:
+        # Locators are lazy, so they can be built once and reused across navigations
+        self._posts_loc = page.locator(self.locators.POST_ITEMS_LOCATOR)
+        self._pagination_loc = page.locator(self.locators.PAGINATION_LOCATOR)
+        self._current_page_loc = page.locator(self.locators.CURRENT_PAGE_LOCATOR)
+        self._next_loc = page.locator(self.locators.NEXT_PAGE_LOCATOR)
+        self._prev_loc = page.locator(self.locators.PREVIOUS_PAGE_LOCATOR)
+        self._page_number_locs: Dict[int, Locator] = {}
+
+    def _page_number_locator(self, page_number: int) -> Locator:
+        """Return the cached pagination locator for the given page number."""
+        locator = self._page_number_locs.get(page_number)
+        if locator is None:
+            locator = self._pagination_loc.locator(
+                self.locators.PAGINATION_NUMBER_LOCATOR.format(page_number=page_number)
+            )
+            self._page_number_locs[page_number] = locator
+        return locator
+
+    def _wait_for_pagination(self) -> None:
         """
-        Extracts a PostItem from a post element.
-        :param post_element: The element representing a post.
-        :return: PostItem object containing title, image URL, created date, and the element itself.
+        Wait until the page reached after a pagination click can be read.
+        Why not "load"?
+            { "load" also waits for every image and font of the post grid. The
+              assertions only need the parsed DOM and the current page marker. }
         """
-        """Extract PostItem from a post element."""
-        title_el = post_element.query_selector(self.locators.POST_TITLE_LOCATOR)
-        image_el = post_element.query_selector(self.locators.POST_IMAGE_LOCATOR)
-        date_el = post_element.query_selector(self.locators.POST_DATE_LOCATOR)
-
-        if not all([title_el, image_el, date_el]):
-            return None
-
-        return PostItem(
-            title=title_el.inner_text().strip(),
-            image_url=image_el.get_attribute("src"),
-            created_date=date_el.inner_text().strip(),
-            element=post_element,
+        self.page.wait_for_load_state("domcontentloaded")
+        self._current_page_loc.first.wait_for(
+            state="attached", timeout=TimeoutConstants.ELEMENT_TIMEOUT * 1000
         )
 
+    def get_post_count(self) -> int:
+        """
+        Count the post items on the home page without reading their fields.
+        """
+        return self._posts_loc.count()
+
     def get_all_posts(self) -> List[PostItem]:
         """
         Retrieve all posts displayed on the home page.
         Returns a list of PostItem objects.
+        Why one evaluate?
+            { Reading title, image and date through element handles costs about six
+              driver round-trips per post. The fields are read in the browser in one
+              call instead; posts keep their index to be located again when clicked. }
         """
-        posts = self.page.query_selector_all(self.locators.POST_ITEMS_LOCATOR)
-        post_items = []
-
-        for post in posts:
-            post_item = self._extract_post_item(post)
-            if post_item:
-                post_items.append(post_item)
-
-        return post_items
+        post_data = self.page.evaluate(
+            _EXTRACT_POSTS_JS,
+            {
+                "items": self.locators.POST_ITEMS_LOCATOR,
+                "title": self.locators.POST_TITLE_LOCATOR,
+                "image": self.locators.POST_IMAGE_LOCATOR,
+                "date": self.locators.POST_DATE_LOCATOR,
+            },
+        )
+        return [
+            PostItem(
+                title=data["title"],
+                image_url=data["image_url"],
+                created_date=data["created_date"],
+                index=data["index"],
+                visible=data["visible"],
+            )
+            for data in post_data
+        ]
 
     def click_on_post_part(
         self, post: PostItem, part: Literal["image", "title", "date"]
@@ -86,30 +150,46 @@ class HomePage:
         :param part: The part to click on ('image', 'title', or 'date').
         :return: PostDetailPage instance after clicking.
         """
-        locators = {
-            "image": self.locators.POST_IMAGE_LOCATOR,
-            "title": self.locators.POST_TITLE_LOCATOR,
-            "date": self.locators.POST_DATE_LOCATOR,
-        }
-        if part not in locators:
+        part_locator = self._PART_LOCATORS.get(part)
+        if part_locator is None:
             raise ValueError(
                 f"Invalid part: {part}. Must be 'image', 'title', or 'date'."
             )
-        target_post = post.element.query_selector(locators[part])
-        if not target_post:
-            raise RuntimeError(f"Could not find the {part} element in the post.")
-        target_post.scroll_into_view_if_needed()
+        if post.index < 0:
+            raise ValueError("The post was not read from the home page (no index).")
+        # Located by index at click time: no element handle to keep alive or go
+        # stale, and get_all_posts only returns posts that have every part
+        target_post = self._posts_loc.nth(post.index).locator(part_locator).first
+        # click() already scrolls the element into view as part of its actionability checks
         target_post.click()
 
         return PostDetailPage(self.page)
 
-    def scroll_to_bottom(self, scroll_count: int = ScrollConstants.SCROLL_STEP) -> None:
+    def scroll_to_bottom(
+        self, *, expected_posts: int = PaginationConstants.POSTS_PER_PAGE
+    ) -> "HomePage":
         """
-        Scroll to the bottom of the page a specified number of times.
-        Each scroll height is equal to the viewport height.
-        :param scroll_count: Number of times to scroll down. Default is 10 times to ensure all posts are loaded.
+        Jump to the bottom of the page and wait until the posts are loaded.
+        :param expected_posts: Keyword-only. Number of post items to wait for.
+            Default is a full page of posts.
+        Why not scroll step by step?
+            { Only the final DOM matters, so one jump plus a wait on the post count
+              replaces the fixed delays between viewport-sized scrolls. }
         """
-        ScrollUtils.scroll_to_bottom(self.page, scroll_count)
+        try:
+            # Pages opened with wait_until="commit" may not have parsed the posts yet
+            self._posts_loc.first.wait_for(
+                state="visible", timeout=TimeoutConstants.SHORT_TIMEOUT * 1000
+            )
+            ScrollUtils.jump_to_bottom(self.page)
+            self.page.wait_for_function(
+                _POSTS_LOADED_JS,
+                arg=[self.locators.POST_ITEMS_LOCATOR, expected_posts],
+                timeout=TimeoutConstants.SHORT_TIMEOUT * 1000,
+            )
+        except PlaywrightTimeoutError:
+            # A page with fewer (or no) posts is left to the assertions to report
+            pass
         return self
 
     def get_current_page_number(self) -> int:
@@ -118,12 +198,17 @@ class HomePage:
         Returns:
             int: The current page number.
         """
-        try:
-            current_page_element = self.page.locator(self.locators.CURRENT_PAGE_LOCATOR)
-        except TimeoutError:
+        # locator() never raises; probe count() so a page without pagination
+        # returns 1 right away instead of waiting out the default timeout
+        if self._current_page_loc.count() == 0:
             return 1
 
-        current_page_text = current_page_element.inner_text().strip()
+        current_page_text = (
+            self._current_page_loc.first.text_content(
+                timeout=TimeoutConstants.PROBE_TIMEOUT * 1000
+            )
+            or ""
+        ).strip()
         if not current_page_text:
             return 1
 
@@ -134,13 +219,10 @@ class HomePage:
         Click to navigate to a specific page in the pagination.
         :param page_number: The page number to navigate to.
         """
-        pagination = self.page.locator(self.locators.PAGINATION_LOCATOR)
-        target_page = pagination.locator(
-            self.locators.PAGINATION_NUMBER_LOCATOR.format(page_number=page_number)
-        )
+        target_page = self._page_number_locator(page_number)
         if target_page.is_visible():
             target_page.click()
-            self.page.wait_for_load_state("load")
+            self._wait_for_pagination()
         return self
 
     def click_pagination_button(
@@ -153,14 +235,8 @@ class HomePage:
         if direction not in ["next", "previous"]:
             raise ValueError("Direction must be 'next' or 'previous'.")
 
-        locator = (
-            self.locators.NEXT_PAGE_LOCATOR
-            if direction == "next"
-            else self.locators.PREVIOUS_PAGE_LOCATOR
-        )
-        direction_button = self.page.locator(locator)
+        direction_button = self._next_loc if direction == "next" else self._prev_loc
         if direction_button.is_visible():
-            direction_button.scroll_into_view_if_needed()
             direction_button.click()
-            self.page.wait_for_load_state("load")
+            self._wait_for_pagination()
         return self
@@ -1,12 +1,12 @@
 from dataclasses import dataclass
-from playwright.sync_api import ElementHandle
 
 
-@dataclass
+@dataclass(slots=True)
 class PostItem:
     title: str
     image_url: str = ""
     created_date: str = ""
-    element: ElementHandle = None
     author: str = ""
     content: str = ""
+    index: int = -1  # Position among the page's post items, used to locate it
+    visible: bool = True  # Whether the post was visible when it was read
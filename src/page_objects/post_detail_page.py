@@ -6,9 +6,18 @@ class PostDetailPage:
 
     def __init__(self, page: Page):
         self.page = page
+        self._title_loc = page.locator(self.POST_TITLE_LOCATOR)
 
-    def get_post_title(self) -> str:
+    def get_post_title(self, rendered: bool = False) -> str:
         """
         Retrieve the title of the post from the post detail page.
+        :param rendered: Read the rendered text (inner_text, applies CSS such as
+            text-transform) instead of the raw DOM text.
+        Why text_content by default?
+            { inner_text() forces a layout to compute the rendered text; the raw
+              DOM text is enough for comparing titles. HomePage reads post titles
+              with textContent too, so both sides of the comparison match. }
         """
-        return self.page.locator(self.POST_TITLE_LOCATOR).inner_text()
+        if rendered:
+            return self._title_loc.inner_text()
+        return (self._title_loc.text_content() or "").strip()
@@ -1,19 +1,19 @@
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
+# Repository root: src/utils/env_utils.py -> parents[2]
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
-def load_dotenv_file():
+
+def load_dotenv_file() -> Path:
     """
     Load environment variables from a .env file.
     """
     # Load environment variables from .env file
     # You can set TARGET_ENV variable to 'dev', 'staging', or 'production'
     environment = os.getenv("TARGET_ENV", "dev")
-    dotenv_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-        ".env",
-        f".env.{environment}",
-    )
+    dotenv_path = _PROJECT_ROOT / ".env" / f".env.{environment}"
     load_dotenv(dotenv_path)
-    
+
     return dotenv_path
@@ -0,0 +1,115 @@
+import hashlib
+import os
+import re
+from pathlib import Path
+from typing import Tuple
+from urllib.parse import urlparse
+
+from playwright.sync_api import BrowserContext, Route
+
+# Static assets worth caching; WordPress appends "?ver=..." so the query is allowed
+STATIC_ASSET_PATTERN = re.compile(
+    r"^[^?#]+\.(css|js|png|jpe?g|webp|gif|svg|woff2?)(\?.*)?$", re.IGNORECASE
+)
+# Repository root: src/utils/route_utils.py -> parents[2]
+STATIC_CACHE_DIR = Path(__file__).resolve().parents[2] / ".cache_static"
+
+# Third-party hosts the home page assertions never depend on
+BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "fonts.googleapis.com",
+    "doubleclick.net",
+)
+
+
+class RouteUtils:
+    """Utility class for network routing shared by all browser contexts.
+    Why?
+        {
+            - Single Responsibility: Request interception lives in one place, not in fixtures
+            - Less Coupling: Page objects stay unaware of how requests are served
+            - Extensibility: Easy to add more routing rules without affecting existing code
+        }
+    """
+
+    @staticmethod
+    def install_routes(context: BrowserContext) -> BrowserContext:
+        """
+        Apply the routing enabled through environment variables to a new context.
+        Both routes are opt-in: once any route is registered, Playwright disables the
+        browser HTTP cache for the context, so repeat loads (go_back, pagination)
+        fetch every CSS/JS file again unless PLW_CACHE_STATIC serves them from disk.
+
+        Args:
+            context: Playwright BrowserContext to install the routes on
+
+        Returns:
+            The same context, for chaining
+        """
+        if os.getenv("PLW_CACHE_STATIC", "0") == "1":
+            RouteUtils.cache_static_assets(context)
+        # Registered last so it wins over the cache route: Playwright tries the
+        # most recently added matching route first
+        if os.getenv("PLW_BLOCK_THIRD_PARTY", "0") == "1":
+            RouteUtils.block_domains(context)
+        return context
+
+    @staticmethod
+    def block_domains(
+        context: BrowserContext, domains: Tuple[str, ...] = BLOCKED_DOMAINS
+    ) -> None:
+        """
+        Abort every request sent to the given domains or their subdomains.
+
+        Args:
+            context: Playwright BrowserContext to install the route on
+            domains: Domain names to block
+        """
+        # Match on the host in the pattern itself, so only blocked requests are
+        # routed back to Python instead of every request of the page
+        blocked_hosts = "|".join(re.escape(domain) for domain in domains)
+        pattern = re.compile(
+            rf"^[a-z]+://([^/?#]*\.)?({blocked_hosts})(:\d+)?([/?#]|$)"
+        )
+        context.route(pattern, lambda route: route.abort())
+
+    @staticmethod
+    def cache_static_assets(
+        context: BrowserContext, cache_dir: Path = STATIC_CACHE_DIR
+    ) -> None:
+        """
+        Serve static assets (CSS, JS, images, fonts) from a local disk cache.
+        The first request for a URL is fetched from the network and stored under
+        cache_dir; later requests, in this or any later run, are fulfilled from disk.
+
+        Args:
+            context: Playwright BrowserContext to install the route on
+            cache_dir: Directory holding the cached files
+        """
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        def handle(route: Route) -> None:
+            url = route.request.url
+            # Keep the extension so fulfill(path=...) can infer the content type
+            suffix = Path(urlparse(url).path).suffix.lower()
+            cached_file = cache_dir / f"{hashlib.md5(url.encode()).hexdigest()}{suffix}"
+
+            if cached_file.exists():
+                # Fonts and scripts may be loaded cross-origin
+                route.fulfill(
+                    path=cached_file, headers={"access-control-allow-origin": "*"}
+                )
+                return
+
+            response = route.fetch()
+            if response.ok:
+                # Write then rename, so a parallel xdist worker never reads a partial file
+                partial_file = cached_file.with_name(
+                    f"{cached_file.name}.{os.getpid()}.part"
+                )
+                partial_file.write_bytes(response.body())
+                os.replace(partial_file, cached_file)
+            route.fulfill(response=response)
+
+        context.route(STATIC_ASSET_PATTERN, handle)
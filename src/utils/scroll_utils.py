@@ -1,6 +1,18 @@
 from playwright.sync_api import Page
 from src.constants.test_configs import ScrollConstants
 
+# Scroll loop run inside the page so the driver waits on one evaluate call
+# instead of one evaluate + wait_for_timeout round-trip per step.
+# Each step is 1/divisor of the viewport height, read on every iteration.
+_SCROLL_LOOP_JS = """
+async ({count, divisor, delay}) => {
+    for (let i = 0; i < count; i++) {
+        window.scrollBy(0, Math.floor(window.innerHeight / divisor));
+        await new Promise((resolve) => setTimeout(resolve, delay));
+    }
+}
+"""
+
 
 class ScrollUtils:
     """Utility class for common scrolling operations across page objects.
@@ -26,9 +38,14 @@ class ScrollUtils:
             delay: Delay in milliseconds between scrolls. Uses ScrollConstants.SCROLL_DELAY if not provided.
         """
         delay = delay or ScrollConstants.SCROLL_DELAY
-        for _ in range(scroll_count):
-            page.evaluate("window.scrollBy(0, window.innerHeight)")
-            page.wait_for_timeout(delay)
+        page.evaluate(
+            _SCROLL_LOOP_JS, {"count": scroll_count, "divisor": 1, "delay": delay}
+        )
+
+    @staticmethod
+    def jump_to_bottom(page: Page) -> None:
+        """Scroll straight to the bottom of the page in a single step."""
+        page.evaluate("() => window.scrollTo(0, document.body.scrollHeight)")
 
     @staticmethod
     def scroll_to_top(page: Page) -> None:
@@ -72,9 +89,11 @@ class ScrollUtils:
             delay: Delay between scroll steps
         """
         delay = delay or ScrollConstants.SCROLL_DELAY
-        viewport_height = page.evaluate("window.innerHeight")
-        scroll_step = viewport_height // 4  # Scroll 1/4 of viewport height at a time
-
-        for _ in range(scroll_count * 4):  # More steps for smoother scrolling
-            page.evaluate(f"window.scrollBy(0, {scroll_step})")
-            page.wait_for_timeout(delay // 4)
+        page.evaluate(
+            _SCROLL_LOOP_JS,
+            {
+                "count": scroll_count * 4,  # More steps for smoother scrolling
+                "divisor": 4,  # Scroll 1/4 of viewport height at a time
+                "delay": delay // 4,
+            },
+        )
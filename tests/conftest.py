@@ -1,8 +1,13 @@
-import importlib
+import json
+import os
 import pytest
-from typing import Generator
+from functools import lru_cache
+from typing import Callable, Dict, Generator, Optional, Tuple
+from playwright.sync_api import Browser, BrowserContext
+from src.constants.test_configs import BrowserConstants
 from src.core.decoration_controller import TestDecorationController
 from src.core.logger_controller import LoggerController
+from src.utils.route_utils import RouteUtils
 from tests.test_home_page_posts.assertions import HomePageAssertions
 
 
@@ -20,11 +25,74 @@ def load_env():
 
     # Load environment variables from the appropriate .env file based on the ENVIRONMENT variable
     # This ensures that the environment is set up correctly for the tests.
+    # Under pytest-xdist every worker runs its own session and loads the file itself
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
     dotenv_path = load_dotenv_file()
-    print(f"Environment variables loaded from: {dotenv_path}")
+    print(f"[{worker}] Environment variables loaded from: {dotenv_path}")
     yield
 
 
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args, browser_name) -> Dict:
+    """
+    Extend pytest-playwright's launch args with Chromium flags when running in CI.
+    Why only in CI?
+        { The flags work around container limits (tiny /dev/shm, no sandbox support);
+          locally the default sandboxed launch is kept. }
+    """
+    if not os.getenv("CI") or browser_name != "chromium":
+        return browser_type_launch_args
+    return {
+        **browser_type_launch_args,
+        "args": [
+            *browser_type_launch_args.get("args", []),
+            *BrowserConstants.CI_CHROMIUM_ARGS,
+        ],
+    }
+
+
+@pytest.fixture(scope="session")
+def warm_storage_state(request, tmp_path_factory) -> Optional[str]:
+    """
+    Visit the site once per worker and save its storage state (PLW_WARM_STATE=1).
+    Why?
+        { Cookies and localStorage set on the first visit (consent banners, site
+          preferences) are then already present in every test context. Only that
+          state is carried over: the HTTP cache and the loaded DOM are not. }
+    Why getfixturevalue("browser")?
+        { browser_context_args depends on this fixture, and the autouse device_marker /
+          screen_sizes fixtures on browser_context_args: requesting browser directly
+          would launch it for every session, even when warm state is off. }
+    """
+    if os.getenv("PLW_WARM_STATE", "0") != "1":
+        return None
+
+    from src.constants.urls import WebUrls
+
+    browser: Browser = request.getfixturevalue("browser")
+
+    # tmp_path_factory gives every xdist worker its own directory
+    state_path = tmp_path_factory.mktemp("storage_state") / "state.json"
+    warm_context = browser.new_context()
+    try:
+        warm_page = warm_context.new_page()
+        warm_page.goto(WebUrls.BASE_URL, wait_until="domcontentloaded")
+        warm_context.storage_state(path=state_path)
+    finally:
+        warm_context.close()
+    return str(state_path)
+
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args, warm_storage_state) -> Dict:
+    """
+    Extend pytest-playwright's context args with the warmed storage state, if any.
+    """
+    if warm_storage_state:
+        return {**browser_context_args, "storage_state": warm_storage_state}
+    return browser_context_args
+
+
 @pytest.fixture
 def logger_controller(request) -> Generator[LoggerController, None, None]:
     """
@@ -53,6 +121,9 @@ def pytest_generate_tests(metafunc):
 
 @pytest.fixture(scope="function", autouse=True)
 def device_marker(request, browser_context_args, playwright):
+    # browser_context_args is session-scoped: restore it so the device
+    # does not leak into the next tests run by this worker
+    original_args = dict(browser_context_args)
     device_marker = TestDecorationController.get_maker_value(request, "device_marker")
     if device_marker:
         try:
@@ -60,15 +131,89 @@ def device_marker(request, browser_context_args, playwright):
         except KeyError:
             print(f"Device {device_marker} is not supported.")
     yield
+    browser_context_args.clear()
+    browser_context_args.update(original_args)
+
+
+@lru_cache(maxsize=32)
+def _parse_sizes(sizes: str) -> Tuple[int, int]:
+    """Parse a "width, height" screen_sizes value once per distinct string."""
+    width, height = sizes.replace(" ", "").split(",")
+    return int(width), int(height)
 
 
 @pytest.fixture(scope="function", autouse=True)
 def screen_sizes(request, browser_context_args):
+    # Same as device_marker: keep the viewport scoped to this test
+    original_args = dict(browser_context_args)
     sizes = TestDecorationController.get_maker_value(request, "screen_sizes")
     if sizes:
-        width, height = sizes.replace(" ", "").split(",")
-        browser_context_args.update(
-            viewport={"width": int(width), "height": int(height)}
-        )
+        # Fresh dict per test: the cached value is an immutable tuple
+        width, height = _parse_sizes(sizes)
+        browser_context_args.update(viewport={"width": width, "height": height})
 
     yield
+    browser_context_args.clear()
+    browser_context_args.update(original_args)
+
+
+@pytest.fixture(scope="session")
+def _context_cache() -> Generator[Dict[Tuple, BrowserContext], None, None]:
+    """
+    Browser contexts reused across tests, keyed by (device, screen size) marker values.
+    """
+    cache: Dict[Tuple, BrowserContext] = {}
+    yield cache
+    for cached_context in cache.values():
+        cached_context.close()
+
+
+@pytest.fixture
+def context(
+    request,
+    browser: Browser,
+    browser_context_args: Dict,
+    new_context: Callable[..., BrowserContext],
+    _context_cache: Dict[Tuple, BrowserContext],
+    warm_storage_state: Optional[str],
+    device_marker,
+    screen_sizes,
+) -> Generator[BrowserContext, None, None]:
+    """
+    Override pytest-playwright's context fixture to optionally reuse contexts.
+    Why opt-in (PLW_REUSE_CONTEXT=1)?
+        { Creating a context per test is the isolation pytest-playwright gives by default,
+          and its new_context() also records tracing/video/screenshots on failure.
+          Reusing one context per (device, screen size) skips that per-test bootstrap
+          at the cost of those artifacts; cookies and pages are reset between tests,
+          cookies back to the warmed storage state when there is one. }
+    """
+    if os.getenv("PLW_REUSE_CONTEXT", "0") != "1":
+        yield RouteUtils.install_routes(new_context())
+        return
+
+    # device_marker / screen_sizes have already applied their values to browser_context_args
+    key: Tuple[Optional[str], Optional[str]] = (
+        TestDecorationController.get_maker_value(request, "device_marker"),
+        TestDecorationController.get_maker_value(request, "screen_sizes"),
+    )
+    cached_context = _context_cache.get(key)
+    if cached_context is None:
+        cached_context = RouteUtils.install_routes(
+            browser.new_context(**browser_context_args)
+        )
+        _context_cache[key] = cached_context
+
+    yield cached_context
+
+    # Reset the shared context for the next test with the same key
+    for opened_page in cached_context.pages:
+        opened_page.close()
+    cached_context.clear_cookies()
+    if warm_storage_state:
+        # storage_state only seeds a context when it is created: restore its cookies
+        with open(warm_storage_state, encoding="utf-8") as state_file:
+            warm_cookies = json.load(state_file).get("cookies", [])
+        if warm_cookies:
+            cached_context.add_cookies(warm_cookies)
+    cached_context.clear_permissions()
@@ -5,6 +5,18 @@ from src.page_objects.post_detail_page import PostDetailPage
 from src.page_objects.home_page import HomePage
 from src.core.logger_controller import LoggerController
 
+_ZERO_WIDTH_TABLE = str.maketrans(
+    "",
+    "",
+    "\u200b"  # Zero Width Space
+    "\u200c"  # Zero Width Non-Joiner
+    "\u200d"  # Zero Width Joiner
+    "\u2060"  # Word Joiner
+    "\ufeff",  # Zero Width No-Break Space (BOM)
+)
+_REMOVED_CATEGORIES = frozenset(("Cf", "Cc", "Cn"))
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class HomePageAssertions:
     """
@@ -20,16 +32,24 @@ class HomePageAssertions:
         allowing tests to focus on behavior while assertions handle validation.
     """
 
-    def __init__(self, page, logger: Optional[LoggerController] = None):
+    def __init__(
+        self,
+        page,
+        logger: Optional[LoggerController] = None,
+        home_page: Optional[HomePage] = None,
+        post_detail_page: Optional[PostDetailPage] = None,
+    ):
         """
         Initialize assertions with page object and optional logger.
 
         Args:
             page: Playwright page object
             logger: Optional logger controller for detailed logging
+            home_page: Optional HomePage to share with the test (built from page if omitted)
+            post_detail_page: Optional PostDetailPage (built from page if omitted)
         """
-        self.home_page = HomePage(page)
-        self.post_detail_page = PostDetailPage(page)
+        self.home_page = home_page or HomePage(page)
+        self.post_detail_page = post_detail_page or PostDetailPage(page)
         self.logger = logger
 
     def _normalize_text(self, text: str) -> str:
@@ -40,29 +60,20 @@ class HomePageAssertions:
         # Step 1: Unicode normalization (NFC)
         text = unicodedata.normalize("NFC", text)
 
-        # Step 2: Remove invisible/control characters
+        # Step 2: Remove zero-width characters in one C-level pass
+        text = text.translate(_ZERO_WIDTH_TABLE)
+
+        # Step 3: Remove invisible/control characters
         # Categories to remove: Cf (format), Cc (control), Cn (unassigned)
         text = "".join(
             char
             for char in text
-            if unicodedata.category(char) not in ["Cf", "Cc", "Cn"]
+            if unicodedata.category(char) not in _REMOVED_CATEGORIES
         )
 
-        # Step 3: Remove zero-width characters specifically
-        zero_width_chars = [
-            "\u200b",  # Zero Width Space
-            "\u200c",  # Zero Width Non-Joiner
-            "\u200d",  # Zero Width Joiner
-            "\u2060",  # Word Joiner
-            "\ufeff",  # Zero Width No-Break Space (BOM)
-        ]
-        for char in zero_width_chars:
-            text = text.replace(char, "")
-
         # Step 4: Normalize whitespace
-        text = re.sub(
-            r"\s+", " ", text
-        )  # Replace multiple whitespace with single space
+        # Replace multiple whitespace with single space
+        text = _WHITESPACE_RE.sub(" ", text)
 
         # Step 5: Strip leading/trailing whitespace
         return text.strip()
@@ -87,11 +98,14 @@ class HomePageAssertions:
         Example:
             assertions.verify_that_all_posts_are_displayed(10)
         """
-        actual_displayed_posts = [
-            post for post in self.home_page.get_all_posts() if post.element.is_visible()
-        ]
-
-        actual_count = len(actual_displayed_posts)
+        # Visible, complete posts are a subset of all post items, so a short raw
+        # count already fails the check without extracting every post
+        actual_count = self.home_page.get_post_count()
+        if actual_count >= expected_count:
+            actual_displayed_posts = [
+                post for post in self.home_page.get_all_posts() if post.visible
+            ]
+            actual_count = len(actual_displayed_posts)
 
         # Log the assertion result (with null check)
         if self.logger:
@@ -104,20 +118,8 @@ class HomePageAssertions:
             actual_count == expected_count
         ), f"Expected {expected_count} posts, but found {actual_count}."
 
-        # Check that all posts have the required attributes
-        for attr in ["title", "image_url", "created_date"]:
-            attr_check_passed = all(
-                hasattr(post, attr) for post in actual_displayed_posts
-            )
-
-            assert attr_check_passed, f"Not all posts have a '{attr}' attribute."
-
-            # Log attribute check result (with null check)
-            if self.logger:
-                self.logger.log_assertion(
-                    f"All posts have a '{attr}' attribute.",
-                    attr_check_passed,
-                )
+        # No per-post attribute check: PostItem always defines title, image_url and
+        # created_date, and get_all_posts skips posts missing any of them.
 
     def verify_navigate_to_post_detail_successfully(self, expected_title: str):
         """
@@ -1,17 +1,28 @@
 import pytest
-from playwright.sync_api import Page
+from typing import Dict, Generator, List
+from playwright.sync_api import Browser, Page
 
 from .assertions import HomePageAssertions
+from src.constants.urls import WebUrls
 from src.page_objects.home_page import HomePage
+from src.page_objects.models.post_item import PostItem
+from src.utils.route_utils import RouteUtils
+
+
+def _is_home_url(url: str) -> bool:
+    """Whether the URL is the home page, ignoring a trailing slash."""
+    return url.rstrip("/") == WebUrls.BASE_URL.rstrip("/")
 
 
 @pytest.fixture
-def assertions(page, logger_controller) -> HomePageAssertions:
+def assertions(page, home_page, logger_controller) -> HomePageAssertions:
     """
     Provide assertions helper with integrated logging.
+    Why home_page?
+        { The test and its assertions then share one HomePage and its cached locators. }
     """
     logger = logger_controller
-    return HomePageAssertions(page, logger)
+    return HomePageAssertions(page, logger, home_page=home_page)
 
 
 @pytest.fixture()
@@ -21,3 +32,82 @@ def home_page(page: Page):
     """
 
     yield HomePage(page)
+
+
+@pytest.fixture(scope="module")
+def shared_page(
+    browser: Browser, browser_context_args: Dict
+) -> Generator[Page, None, None]:
+    """
+    One page kept open for a whole test module.
+    Why?
+        { Tests that only need the loaded home page can share it instead of each
+          opening a context, navigating and scrolling again. It is built outside
+          pytest-playwright's context fixture, so no per-test tracing is recorded. }
+    """
+    shared_context = RouteUtils.install_routes(
+        browser.new_context(**browser_context_args)
+    )
+    yield shared_context.new_page()
+    shared_context.close()
+
+
+@pytest.fixture(scope="module")
+def shared_home(shared_page: Page) -> HomePage:
+    """
+    Home page opened once per module on the shared page.
+    Why "domcontentloaded"?
+        { The pagination tests read the DOM right away; images keep loading in the
+          background instead of holding up the whole module. }
+    """
+    shared_page.goto(WebUrls.BASE_URL, wait_until="domcontentloaded")
+    return HomePage(shared_page)
+
+
+@pytest.fixture(scope="module")
+def loaded_home(shared_home: HomePage) -> HomePage:
+    """
+    Shared home page scrolled once to load all posts.
+    """
+    return shared_home.scroll_to_bottom()
+
+
+@pytest.fixture(scope="module")
+def loaded_posts(loaded_home: HomePage) -> List[PostItem]:
+    """
+    Posts of the shared home page, read once per module.
+    Why is the snapshot still valid after going back?
+        { PostItem only holds values and the post index; click_on_post_part locates
+          the post again by that index on the current document. }
+    """
+    return loaded_home.get_all_posts()
+
+
+@pytest.fixture
+def back_to_home(loaded_home: HomePage) -> Generator[HomePage, None, None]:
+    """
+    Provide the shared home page and return to it after the test navigated away.
+    Why check the URL?
+        { A case that fails before its click navigates is still on the home page;
+          going back then would leave it for about:blank and break every later case. }
+    """
+    yield loaded_home
+    page = loaded_home.page
+    if _is_home_url(page.url):
+        return
+
+    page.go_back()
+    if not _is_home_url(page.url):
+        # History did not lead back home: reload it so the next case starts there
+        page.goto(WebUrls.BASE_URL, wait_until="commit")
+        loaded_home.scroll_to_bottom()
+
+
+@pytest.fixture
+def shared_assertions(shared_home: HomePage, logger_controller) -> HomePageAssertions:
+    """
+    Assertions bound to the shared page instead of the per-test one.
+    """
+    return HomePageAssertions(
+        shared_home.page, logger_controller, home_page=shared_home
+    )
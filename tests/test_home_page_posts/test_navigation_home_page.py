@@ -1,12 +1,20 @@
-from time import sleep
-from playwright.sync_api import Page
+import pytest
 
 from src.page_objects.home_page import HomePage
 from src.constants.urls import WebUrls
 
+# These tests only use the pagination controls, so they deliberately skip
+# home_page.scroll_to_bottom(): click() brings the control into view by itself.
+# They navigate with wait_until="domcontentloaded", not "commit": the pagination
+# helpers probe the DOM right away (is_visible, count) and must not see it empty.
+
+# The tests share one page (shared_home) and continue from where the previous one
+# left it, so the whole file must run on a single xdist worker.
+pytestmark = pytest.mark.xdist_group("home_navigation")
+
 
 def test_verify_that_user_can_navigate_to_the_next_page_of_posts_by_clicking_number(
-    page: Page, home_page: HomePage, assertions
+    shared_home: HomePage, shared_assertions
 ):
     """
     Test to verify that a user can navigate to the next page of posts by clicking the next button.
@@ -23,23 +31,20 @@ def test_verify_that_user_can_navigate_to_the_next_page_of_posts_by_clicking_num
     Expected Result:
         - The current page number should change to the next page number.
     """
-    # Navigate to the home page
-    page.goto(WebUrls.BASE_URL)
+    home_page = shared_home
+    # The shared page opens on the home page; only navigate when run after other tests
+    if home_page.get_current_page_number() != 1:
+        home_page.page.goto(WebUrls.BASE_URL, wait_until="domcontentloaded")
 
-    try:
-        # Click on the next button to navigate to the next page
-        home_page.click_on_page_navigation_number(2)
-
-        # Assert that the current URL has changed to the next page
-        assertions.verify_the_current_page_number(2)
+    # Click on the next button to navigate to the next page
+    home_page.click_on_page_navigation_number(2)
 
-    finally:
-        # Tear down (if necessary)
-        pass
+    # Assert that the current URL has changed to the next page
+    shared_assertions.verify_the_current_page_number(2)
 
 
 def test_verify_that_user_can_navigate_to_the_next_page_of_posts_by_clicking_next_button(
-    page: Page, home_page: HomePage, assertions
+    shared_home: HomePage, shared_assertions
 ):
     """
     Test to verify that a user can navigate to the next page of posts by clicking the next button.
@@ -55,24 +60,21 @@ def test_verify_that_user_can_navigate_to_the_next_page_of_posts_by_clicking_nex
     Expected Result:
         - The current page number should change to the next page number.
     """
-    # Navigate to the home page
-    page.goto(WebUrls.BASE_URL)
-    home_page.click_on_page_navigation_number(2)
-
-    try:
-        # Click on the next button to navigate to the next page
-        home_page.click_pagination_button("next")
+    home_page = shared_home
+    # The previous test leaves the page on page 2; only navigate when run on its own
+    if home_page.get_current_page_number() != 2:
+        home_page.page.goto(WebUrls.BASE_URL, wait_until="domcontentloaded")
+        home_page.click_on_page_navigation_number(2)
 
-        # Assert that the current URL has changed to the next page
-        assertions.verify_the_current_page_number(3)
+    # Click on the next button to navigate to the next page
+    home_page.click_pagination_button("next")
 
-    finally:
-        # Tear down (if necessary)
-        pass
+    # Assert that the current URL has changed to the next page
+    shared_assertions.verify_the_current_page_number(3)
 
 
 def test_verify_that_user_can_navigate_to_the_previous_page_of_posts_by_clicking_previous_button(
-    page: Page, home_page: HomePage, assertions
+    shared_home: HomePage, shared_assertions
 ):
     """
     Test to verify that a user can navigate to the previous page of posts by clicking the previous button.
@@ -88,18 +90,15 @@ def test_verify_that_user_can_navigate_to_the_previous_page_of_posts_by_clicking
     Expected Result:
         - The current page number should change to the previous page number.
     """
-    # Navigate to the home page
-    page.goto(WebUrls.BASE_URL)
-
-    try:
+    home_page = shared_home
+    # The previous test leaves the page past the first one; only navigate when needed
+    start_page_number = home_page.get_current_page_number()
+    if start_page_number == 1:
         # Click on the next button to go to the second page first
         home_page.click_on_page_navigation_number(2)
+        start_page_number = 2
 
-        # Click on the previous button to navigate back to the first page
-        home_page.click_pagination_button("previous")
-        # Assert that the current URL has changed back to the first page
-        assertions.verify_the_current_page_number(1)
-
-    finally:
-        # Tear down (if necessary)
-        pass
+    # Click on the previous button to navigate back to the previous page
+    home_page.click_pagination_button("previous")
+    # Assert that the current URL has changed back to the previous page
+    shared_assertions.verify_the_current_page_number(start_page_number - 1)